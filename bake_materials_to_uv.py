@@ -5,16 +5,26 @@
 from __future__ import annotations
 
 import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 import bpy
 from bpy.types import Operator
 from bpy.props import (
+    BoolProperty,
     EnumProperty,
     StringProperty,
 )
 
+try:
+    # Bundled with recent Blender builds; used to encode PNGs off the main thread.
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
+
 bl_info = {
     "name": "Bake Materials to UV",
     "author": "Embody AI",
@@ -25,31 +35,61 @@ bl_info = {
     "category": "Object",
 }
 
+# State needed to undo a Principled BSDF → Emission rewire after a bake pass.
+RewireRestore = namedtuple('RewireRestore', (
+    'node_tree',
+    'principled',
+    'emission_color_links',
+    'emission_color_default',
+    'emission_strength_value',
+    'temp_nodes',
+))
+
 _image_enum_items = []
+_image_enum_cache_key = None
 _uv_layer_enum_items = []
 
+# zlib level for saved PNGs; level 1 encodes several times faster than the
+# default 6 at a modest size cost, and UE5 recompresses on import anyway.
+_PNG_COMPRESSION_LEVEL = 1
+
+_SKIP_IMAGE_NAMES = frozenset({'Render Result', 'Viewer Node'})
+# Our own intermediates, asset-browser previews and asset metadata images.
+_SKIP_IMAGE_RE = re.compile(r'^(?:_bake_|thumbnail)|asset_type', re.IGNORECASE)
+
+
+def _invalidate_image_items():
+    global _image_enum_cache_key
+    _image_enum_cache_key = None
+
 
 def get_image_items(self, context):
-    global _image_enum_items
+    global _image_enum_items, _image_enum_cache_key
+    # Blender calls this on every redraw of the dialog; only rescan when the
+    # image collection visibly changed or the dialog was (re)opened.
+    images = bpy.data.images
+    cache_key = (len(images), images[0].name if images else '')
+    if cache_key == _image_enum_cache_key:
+        return _image_enum_items
     items = []
-    for img in bpy.data.images:
-        w, h = img.size[0], img.size[1]
+    for img in images:
+        # Slicing reads the whole size array in one RNA call; indexing the
+        # live bpy_prop_array would read it again for each component.
+        w, h = img.size[:]
         if w < 512 or h < 512:
             continue
-        if img.name in {'Render Result', 'Viewer Node'}:
-            continue
-        if img.name.startswith('_bake_'):
-            continue
-        name_lower = img.name.lower()
-        if name_lower.startswith('thumbnail') or 'asset_type' in name_lower:
+        name = img.name
+        if name in _SKIP_IMAGE_NAMES or _SKIP_IMAGE_RE.search(name):
             continue
-        label = f"{img.name} ({w}x{h})"
-        items.append((img.name, label, ""))
+        label = f"{name} ({w}x{h})"
+        items.append((name, label, ""))
     items.reverse()
     if not items:
         items = [('NONE', 'No images available', '')]
-    _image_enum_items = items
-    return items
+    _image_enum_cache_key = cache_key
+    if items != _image_enum_items:
+        _image_enum_items = items
+    return _image_enum_items
 
 
 def get_uv_layer_items(self, context):
@@ -61,8 +101,39 @@ def get_uv_layer_items(self, context):
             items.append((uv_layer.name, uv_layer.name, ""))
     if not items:
         items = [('NONE', 'No UV maps available', '')]
-    _uv_layer_enum_items = items
-    return items
+    # Hand back the previous list when nothing changed, so Blender keeps
+    # seeing the same (still referenced) item strings across redraws.
+    if items != _uv_layer_enum_items:
+        _uv_layer_enum_items = items
+    return _uv_layer_enum_items
+
+
+def _write_png(filepath, pixels, width, height):
+    """Encode flat RGBA float pixels (Blender row order) as an 8-bit RGB PNG.
+
+    Only for byte-buffer images: ``pixels`` then holds the stored values
+    scaled to 0-1, and converting back reproduces what ``Image.save()``
+    writes. Float images hold scene-linear data and must go through
+    ``Image.save()`` instead.
+    """
+    rgb = pixels.reshape(height, width, 4)[::-1, :, :3]
+    data = np.ascontiguousarray(np.rint(rgb * 255.0), dtype=np.uint8)
+    out = oiio.ImageOutput.create(filepath)
+    if out is None:
+        raise RuntimeError(oiio.geterror())
+    # OIIO reports failures through return values rather than exceptions.
+    try:
+        spec = oiio.ImageSpec(width, height, 3, "uint8")
+        spec.attribute("png:compressionLevel", _PNG_COMPRESSION_LEVEL)
+        if not out.open(filepath, spec):
+            raise RuntimeError(out.geterror())
+        if not out.write_image(data):
+            raise RuntimeError(out.geterror())
+    except Exception:
+        out.close()
+        raise
+    if not out.close():
+        raise RuntimeError(out.geterror())
 
 
 class OBJECT_OT_bake_materials_to_uv(Operator):
@@ -83,23 +154,30 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
         items=get_uv_layer_items,
     )
 
+    bake_ao: BoolProperty(
+        name="Bake Ambient Occlusion",
+        description="Bake AO into the ORM red channel (slowest pass); "
+                    "when disabled the channel is filled with white",
+        default=True,
+    )
+
     @classmethod
     def poll(cls, context):
         obj = context.active_object
-        return (
-            obj is not None
-            and obj.type == 'MESH'
-            and obj.data.uv_layers.active is not None
-            and len(obj.data.materials) > 0
-        )
+        if obj is None or obj.type != 'MESH':
+            return False
+        mesh = obj.data
+        return mesh.uv_layers.active is not None and len(mesh.materials) > 0
 
     def invoke(self, context, event):
+        _invalidate_image_items()
         return context.window_manager.invoke_props_dialog(self, width=350)
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "target_uv_layer")
         layout.prop(self, "target_image")
+        layout.prop(self, "bake_ao")
 
     def execute(self, context):
         obj = context.active_object
@@ -116,6 +194,12 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
 
         width, height = target_img.size[0], target_img.size[1]
 
+        # Validate before touching any scene state so a bad input doesn't pay
+        # for the engine/device/selection switches and their rollback.
+        if not self._has_principled_material(obj):
+            self.report({'ERROR'}, "Object has no node-based material with a Principled BSDF")
+            return {'CANCELLED'}
+
         # Set active UV layer
         if self.target_uv_layer != 'NONE':
             uv_layer = obj.data.uv_layers.get(self.target_uv_layer)
@@ -136,93 +220,124 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
         if original_engine != 'CYCLES':
             scene.render.engine = 'CYCLES'
 
-        # Force GPU rendering
+        # Force GPU rendering (OptiX first: it uses RT cores and falls back to
+        # CUDA automatically on NVIDIA cards without OptiX support)
         original_device = scene.cycles.device
         cycles_prefs = context.preferences.addons['cycles'].preferences
         original_compute_type = cycles_prefs.compute_device_type
+        available_backends = {t[0] for t in cycles_prefs.get_device_types(context)}
+        candidates = [b for b in ('OPTIX', 'CUDA', 'HIP', 'ONEAPI', 'METAL')
+                      if b in available_backends]
         gpu_activated = False
-        for backend in ('CUDA', 'OPTIX', 'HIP', 'ONEAPI', 'METAL'):
-            if backend in {t[0] for t in cycles_prefs.get_device_types(context)}:
-                cycles_prefs.compute_device_type = backend
-                cycles_prefs.get_devices()
-                for device in cycles_prefs.devices:
-                    device.use = True
-                scene.cycles.device = 'GPU'
+        # get_devices() probes the drivers, so normally it runs once for the
+        # first candidate; later ones are only tried if that backend turns out
+        # to have no usable device (otherwise the bake would silently run on
+        # an empty GPU device list).
+        for backend in candidates:
+            if self._activate_gpu_backend(cycles_prefs, backend):
                 gpu_activated = True
                 break
-        if not gpu_activated:
+        if gpu_activated:
+            scene.cycles.device = 'GPU'
+        else:
             scene.cycles.device = 'CPU'
-
-        # Make library-linked materials local so we can inject bake nodes
-        original_materials = self._make_materials_local(obj)
+            if candidates:
+                self.report({'WARNING'}, "No usable GPU device found; baking on CPU")
 
         # Create bake target images
+        channels = ['basecolor', 'normal', 'roughness', 'metallic',
+                    'emissive', 'opacity']
+        if self.bake_ao:
+            channels.append('ao')
         bake_images = {}
-        for ch in ('basecolor', 'normal', 'ao', 'roughness', 'metallic',
-                    'emissive', 'opacity'):
-            bake_images[ch] = bpy.data.images.new(
-                f"_bake_{ch}", width=width, height=height, alpha=False,
-            )
+        for ch in channels:
+            bake_images[ch] = self._acquire_bake_image(f"_bake_{ch}", width, height)
+
+        # Emission, normal and roughness bakes read a fixed value per shading
+        # point, so extra samples are wasted work; only AO needs the scene's.
+        original_samples = scene.cycles.samples
+        original_use_denoising = scene.cycles.use_denoising
 
         wm = context.window_manager
         wm.progress_begin(0, 7)
         success = False
+        original_materials = {}
+        temp_nodes = []
 
         try:
             bake_settings = scene.render.bake
 
-            # 1/7: Emissive (must bake real emission before any rewires)
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['emissive'])
-            wm.progress_update(0)
+            # Make library-linked materials local so we can inject bake nodes.
+            # Done inside the try so a partial failure is still rolled back.
+            self._make_materials_local(obj, original_materials)
+            materials = self._bakeable_materials(obj)
+            principled_nodes = self._collect_principled(materials)
+
+            # Unlinked, identical Metallic/Alpha inputs don't need a render pass.
+            metallic_value = self._uniform_input_value(principled_nodes, "Metallic")
+            opacity_value = self._uniform_input_value(principled_nodes, "Alpha")
+
+            scene.cycles.samples = 1
+            scene.cycles.use_denoising = False
+
+            # Inject the bake target nodes once; each pass only swaps the image.
+            temp_nodes = self._inject_bake_nodes(materials)
+
+            # Progress is reported after each stage completes; the bakes
+            # dominate wall time, so one update per stage is plenty.
+
+            # 1/6: Emissive (must bake real emission before any rewires)
+            self._set_bake_target(temp_nodes, bake_images['emissive'])
             bpy.ops.object.bake(type='EMIT')
-            self._remove_bake_nodes(temp_nodes)
+            wm.progress_update(1)
 
-            # 2/7: Base Color (via Emission rewire — captures raw color
+            # 2/6: Base Color (via Emission rewire — captures raw color
             #       regardless of transmission/alpha)
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['basecolor'])
-            restore_data = self._setup_rewire(obj, "Base Color")
-            wm.progress_update(1)
+            self._set_bake_target(temp_nodes, bake_images['basecolor'])
+            restore_data = self._setup_rewire(principled_nodes, "Base Color")
             bpy.ops.object.bake(type='EMIT')
             self._restore_rewire(restore_data)
-            self._remove_bake_nodes(temp_nodes)
-
-            # 3/7: Normal
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['normal'])
             wm.progress_update(2)
-            bpy.ops.object.bake(type='NORMAL')
-            self._remove_bake_nodes(temp_nodes)
 
-            # 4/7: AO
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['ao'])
+            # 3/6: Normal
+            self._set_bake_target(temp_nodes, bake_images['normal'])
+            bpy.ops.object.bake(type='NORMAL')
             wm.progress_update(3)
-            bpy.ops.object.bake(type='AO')
-            self._remove_bake_nodes(temp_nodes)
 
-            # 5/7: Roughness
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['roughness'])
+            # 4/6: AO (sampled pass — use the scene's own settings)
+            if self.bake_ao:
+                self._set_bake_target(temp_nodes, bake_images['ao'])
+                scene.cycles.samples = original_samples
+                scene.cycles.use_denoising = original_use_denoising
+                bpy.ops.object.bake(type='AO')
+                scene.cycles.samples = 1
+                scene.cycles.use_denoising = False
             wm.progress_update(4)
-            bpy.ops.object.bake(type='ROUGHNESS')
-            self._remove_bake_nodes(temp_nodes)
 
-            # 6/7: Opacity (Alpha → Emission rewire)
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['opacity'])
-            restore_data = self._setup_rewire(obj, "Alpha")
+            # 5/6: Roughness
+            self._set_bake_target(temp_nodes, bake_images['roughness'])
+            bpy.ops.object.bake(type='ROUGHNESS')
             wm.progress_update(5)
-            bpy.ops.object.bake(type='EMIT')
-            self._restore_rewire(restore_data)
-            self._remove_bake_nodes(temp_nodes)
 
-            # 7/7: Metallic (Metallic → Emission rewire)
-            temp_nodes = self._inject_bake_nodes(obj, bake_images['metallic'])
-            restore_data = self._setup_rewire(obj, "Metallic")
+            # 6/6: Metallic + Opacity in one pass (Metallic → Emission R,
+            #      Alpha → Emission G), split into separate maps afterwards
+            if metallic_value is None or opacity_value is None:
+                self._set_bake_target(temp_nodes, bake_images['metallic'])
+                restore_data = self._setup_packed_rewire(
+                    principled_nodes, {'Red': "Metallic", 'Green': "Alpha"},
+                )
+                bpy.ops.object.bake(type='EMIT')
+                self._restore_rewire(restore_data)
+                self._split_channel(bake_images['metallic'], bake_images['opacity'], 1)
+            if opacity_value is not None:
+                self._fill_image(bake_images['opacity'], opacity_value)
+            if metallic_value is not None:
+                self._fill_image(bake_images['metallic'], metallic_value)
             wm.progress_update(6)
-            bpy.ops.object.bake(type='EMIT')
-            self._restore_rewire(restore_data)
-            self._remove_bake_nodes(temp_nodes)
 
             # Pack ORM texture: AO(R) + Roughness(G) + Metallic(B)
             orm_img = self._pack_orm(
-                bake_images['ao'], bake_images['roughness'],
+                bake_images.get('ao'), bake_images['roughness'],
                 bake_images['metallic'], width, height,
             )
             bake_images['orm'] = orm_img
@@ -235,7 +350,10 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
 
         finally:
             wm.progress_end()
+            self._remove_bake_nodes(temp_nodes)
             self._restore_original_materials(obj, original_materials)
+            scene.cycles.samples = original_samples
+            scene.cycles.use_denoising = original_use_denoising
             scene.cycles.device = original_device
             cycles_prefs.compute_device_type = original_compute_type
             scene.render.engine = original_engine
@@ -264,6 +382,24 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _activate_gpu_backend(cycles_prefs, backend):
+        """Switch Cycles to ``backend`` and enable its devices.
+
+        Every device of the backend is enabled so multi-GPU machines split
+        the bake; CPU entries are left as the user configured them since they
+        would stall the GPUs in hybrid mode. Returns False if the backend
+        exposes no devices.
+        """
+        cycles_prefs.compute_device_type = backend
+        cycles_prefs.get_devices()
+        found = False
+        for device in cycles_prefs.devices:
+            if device.type == backend:
+                device.use = True
+                found = True
+        return found
+
     @staticmethod
     def _safe_remove_image(img):
         """Remove an Image datablock, tolerating None and already-removed refs.
@@ -276,20 +412,48 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
         if img is None:
             return
         try:
-            if img.name in bpy.data.images:
+            # Hashed name lookup; comparing the result also guards against
+            # removing an unrelated image that happens to share the name.
+            if bpy.data.images.get(img.name) == img:
                 bpy.data.images.remove(img)
         except ReferenceError:
             pass  # datablock already gone — nothing to clean up
 
-    def _make_materials_local(self, obj):
-        original_materials = {}
+    @classmethod
+    def _acquire_bake_image(cls, name, width, height):
+        """Return a bake target image called ``name``, reusing a leftover one.
+
+        Outputs from a previous bake stay in ``bpy.data`` until they are saved.
+        Reusing them when the resolution matches avoids reallocating the
+        buffers, and keeps the exact names the save operator looks up instead
+        of piling up ``.001`` duplicates. A reused image is reset to black so
+        the bake starts from the same state as a fresh one, even with the
+        scene's Clear Image option off; its previous contents are discarded.
+        """
+        img = bpy.data.images.get(name)
+        if img is not None:
+            # Only reuse byte buffers; the save path relies on bake images
+            # never being float.
+            if (tuple(img.size) == (width, height)
+                    and img.source == 'GENERATED' and not img.is_float):
+                cls._fill_image(img, 0.0)
+                return img
+            cls._safe_remove_image(img)
+        return bpy.data.images.new(name, width=width, height=height, alpha=False)
+
+    def _make_materials_local(self, obj, original_materials):
+        """Swap library-linked materials for local copies.
+
+        ``original_materials`` is filled in place (slot index → linked
+        material) as each slot is swapped, so the caller can restore whatever
+        was changed even if this raises part-way through.
+        """
         for idx, mat_slot in enumerate(obj.material_slots):
             mat = mat_slot.material
             if mat is not None and mat.library is not None:
                 local_mat = mat.copy()
                 original_materials[idx] = mat
                 obj.material_slots[idx].material = local_mat
-        return original_materials
 
     def _restore_original_materials(self, obj, original_materials):
         for idx, original_mat in original_materials.items():
@@ -298,28 +462,52 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
             if local_mat is not None and local_mat.users == 0:
                 bpy.data.materials.remove(local_mat)
 
-    def _inject_bake_nodes(self, obj, bake_image):
-        temp_nodes = []
+    def _has_principled_material(self, obj):
+        # Library-linked materials count: they are made local before baking.
+        for mat_slot in obj.material_slots:
+            mat = mat_slot.material
+            if mat is None or not mat.use_nodes or mat.node_tree is None:
+                continue
+            if self._find_principled(mat.node_tree)[0] is not None:
+                return True
+        return False
+
+    @staticmethod
+    def _bakeable_materials(obj):
+        """Return the object's local, node-based materials, each listed once."""
+        materials = []
         for mat_slot in obj.material_slots:
             mat = mat_slot.material
             if mat is None or not mat.use_nodes or mat.node_tree is None:
                 continue
             if mat.library is not None:
                 continue
+            if mat not in materials:
+                materials.append(mat)
+        return materials
 
-            nodes = mat.node_tree.nodes
-            for n in nodes:
-                n.select = False
+    def _inject_bake_nodes(self, materials):
+        """Add a single bake target image node to every material.
 
+        The nodes are reused for all passes; ``_set_bake_target`` points them
+        at the image for the current pass.
+        """
+        temp_nodes = []
+        for mat in materials:
+            nodes = mat.node_tree.nodes
             bake_node = nodes.new('ShaderNodeTexImage')
             bake_node.name = "_bake_temp_node"
-            bake_node.image = bake_image
-            bake_node.select = True
-            nodes.active = bake_node
-
             temp_nodes.append((mat, bake_node))
         return temp_nodes
 
+    def _set_bake_target(self, temp_nodes, bake_image):
+        # Re-assert select/active every pass: Cycles reads the active image
+        # node of each material to find where to write.
+        for mat, node in temp_nodes:
+            node.image = bake_image
+            node.select = True
+            mat.node_tree.nodes.active = node
+
     def _remove_bake_nodes(self, temp_nodes):
         for mat, node in temp_nodes:
             if mat.node_tree is not None:
@@ -338,47 +526,88 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
                     return result, result_tree
         return None, None
 
-    def _setup_rewire(self, obj, source_input_name):
-        """Route a Principled BSDF input (e.g. 'Metallic', 'Alpha') to Emission for baking."""
-        restore_data = []
-        seen_principled = set()
-        for mat_slot in obj.material_slots:
-            mat = mat_slot.material
-            if mat is None or not mat.use_nodes or mat.node_tree is None:
-                continue
-            if mat.library is not None:
-                continue
+    def _collect_principled(self, materials):
+        """Return unique ``(principled, containing_tree)`` pairs for the materials.
 
+        Computed once per bake so the rewire passes don't re-walk every node
+        graph (including nested groups) each time.
+        """
+        principled_nodes = []
+        seen_principled = set()
+        for mat in materials:
             principled, containing_tree = self._find_principled(mat.node_tree)
             if principled is None:
                 continue
 
-            # Skip if we already rewired this node (shared node groups)
+            # Skip if we already found this node (shared node groups)
             node_ptr = principled.as_pointer()
             if node_ptr in seen_principled:
                 continue
             seen_principled.add(node_ptr)
+            principled_nodes.append((principled, containing_tree))
+        return principled_nodes
+
+    @staticmethod
+    def _uniform_input_value(principled_nodes, input_name):
+        """Return the shared value of an unlinked scalar input, if bakeable as a fill.
+
+        Only 0.0 and 1.0 qualify: the EMIT bake stores results in the image's
+        sRGB colorspace, and those are the only values that map to themselves.
+        """
+        value = None
+        for principled, _containing_tree in principled_nodes:
+            socket = principled.inputs[input_name]
+            if socket.is_linked:
+                return None
+            if value is None:
+                value = socket.default_value
+            elif socket.default_value != value:
+                return None
+        if value not in (0.0, 1.0):
+            return None
+        return value
 
+    @staticmethod
+    def _fill_image(img, value):
+        width, height = img.size
+        pixels = np.full(width * height * 4, value, dtype=np.float32)
+        pixels[3::4] = 1.0
+        img.pixels.foreach_set(pixels)
+
+    @staticmethod
+    def _detach_emission(principled, containing_tree):
+        """Record the Emission inputs of ``principled`` and unlink Emission Color."""
+        emission_color_input = principled.inputs["Emission Color"]
+        emission_strength_input = principled.inputs["Emission Strength"]
+
+        restore = RewireRestore(
+            node_tree=containing_tree,
+            principled=principled,
+            emission_color_links=[
+                link.from_socket for link in emission_color_input.links
+            ],
+            emission_color_default=list(emission_color_input.default_value),
+            emission_strength_value=emission_strength_input.default_value,
+            temp_nodes=[],
+        )
+
+        links = containing_tree.links
+        # Emission Color is a single-input socket: at most one link.
+        if emission_color_input.is_linked:
+            links.remove(emission_color_input.links[0])
+        emission_strength_input.default_value = 1.0
+        return restore
+
+    def _setup_rewire(self, principled_nodes, source_input_name):
+        """Route a Principled BSDF input (e.g. 'Metallic', 'Alpha') to Emission for baking."""
+        restore_data = []
+        for principled, containing_tree in principled_nodes:
             nodes = containing_tree.nodes
             links = containing_tree.links
 
             source_input = principled.inputs[source_input_name]
             emission_color_input = principled.inputs["Emission Color"]
-            emission_strength_input = principled.inputs["Emission Strength"]
-
-            restore = {
-                'node_tree': containing_tree,
-                'principled': principled,
-                'emission_color_links': [
-                    link.from_socket for link in emission_color_input.links
-                ],
-                'emission_color_default': list(emission_color_input.default_value),
-                'emission_strength_value': emission_strength_input.default_value,
-                'temp_nodes': [],
-            }
-
-            for link in list(emission_color_input.links):
-                links.remove(link)
+            restore = self._detach_emission(principled, containing_tree)
 
             if source_input.is_linked:
                 source = source_input.links[0].from_socket
@@ -393,47 +622,97 @@ class OBJECT_OT_bake_materials_to_uv(Operator):
                 else:
                     rgb_node.outputs[0].default_value = (val, val, val, 1.0)
                 links.new(rgb_node.outputs[0], emission_color_input)
-                restore['temp_nodes'].append(rgb_node)
+                restore.temp_nodes.append(rgb_node)
+
+            restore_data.append(restore)
+        return restore_data
+
+    def _setup_packed_rewire(self, principled_nodes, channel_inputs):
+        """Route several scalar inputs to Emission, one per color channel.
+
+        ``channel_inputs`` maps 'Red'/'Green'/'Blue' to Principled input names,
+        so a single EMIT bake captures up to three grayscale maps.
+        """
+        restore_data = []
+        for principled, containing_tree in principled_nodes:
+            nodes = containing_tree.nodes
+            links = containing_tree.links
+
+            emission_color_input = principled.inputs["Emission Color"]
+            restore = self._detach_emission(principled, containing_tree)
+
+            combine = nodes.new('ShaderNodeCombineColor')
+            combine.name = "_bake_packed_temp"
+            for channel, input_name in channel_inputs.items():
+                source_input = principled.inputs[input_name]
+                if source_input.is_linked:
+                    links.new(source_input.links[0].from_socket, combine.inputs[channel])
+                else:
+                    combine.inputs[channel].default_value = source_input.default_value
+            links.new(combine.outputs[0], emission_color_input)
+            restore.temp_nodes.append(combine)
 
-            emission_strength_input.default_value = 1.0
             restore_data.append(restore)
         return restore_data
 
     def _restore_rewire(self, restore_data):
         for restore in restore_data:
-            containing_tree = restore['node_tree']
-            principled = restore['principled']
+            containing_tree = restore.node_tree
+            principled = restore.principled
             links = containing_tree.links
             nodes = containing_tree.nodes
 
             emission_color_input = principled.inputs["Emission Color"]
             emission_strength_input = principled.inputs["Emission Strength"]
 
-            for link in list(emission_color_input.links):
-                links.remove(link)
-            for from_socket in restore['emission_color_links']:
+            if emission_color_input.is_linked:
+                links.remove(emission_color_input.links[0])
+            for from_socket in restore.emission_color_links:
                 links.new(from_socket, emission_color_input)
 
-            emission_color_input.default_value = restore['emission_color_default']
-            emission_strength_input.default_value = restore['emission_strength_value']
+            emission_color_input.default_value = restore.emission_color_default
+            emission_strength_input.default_value = restore.emission_strength_value
 
-            for temp_node in restore['temp_nodes']:
+            for temp_node in restore.temp_nodes:
                 nodes.remove(temp_node)
 
+    @staticmethod
+    def _split_channel(src_img, dst_img, channel):
+        """Write channel ``channel`` of ``src_img`` into ``dst_img`` as grayscale."""
+        width, height = src_img.size
+        src = np.empty(width * height * 4, dtype=np.float32)
+        src_img.pixels.foreach_get(src)
+        dst = np.empty_like(src)
+        for i in range(3):
+            dst[i::4] = src[channel::4]
+        dst[3::4] = 1.0
+        dst_img.pixels.foreach_set(dst)
+
     def _pack_orm(self, ao_img, rough_img, metal_img, width, height):
-        """Pack AO(R), Roughness(G), Metallic(B) into a single ORM texture."""
-        ao = np.array(ao_img.pixels[:]).reshape(-1, 4)
-        rough = np.array(rough_img.pixels[:]).reshape(-1, 4)
-        metal = np.array(metal_img.pixels[:]).reshape(-1, 4)
-
-        orm = np.ones((width * height, 4), dtype=np.float32)
-        orm[:, 0] = ao[:, 0]       # R = Ambient Occlusion
-        orm[:, 1] = rough[:, 0]    # G = Roughness
-        orm[:, 2] = metal[:, 0]    # B = Metallic
-        orm[:, 3] = 1.0            # A = 1.0
-
-        orm_img = bpy.data.images.new("_bake_orm", width=width, height=height, alpha=False)
-        orm_img.pixels = orm.flatten().tolist()
+        """Pack AO(R), Roughness(G), Metallic(B) into a single ORM texture.
+
+        ``ao_img`` may be None when AO baking is disabled; R is then white.
+        """
+        # foreach_get/foreach_set copy straight between Blender's pixel
+        # buffers and NumPy, with no per-pixel Python floats in between. One
+        # scratch buffer is reused for all three sources.
+        size = width * height * 4
+        src = np.empty(size, dtype=np.float32)
+        orm = np.empty(size, dtype=np.float32)
+
+        if ao_img is not None:
+            ao_img.pixels.foreach_get(src)
+            orm[0::4] = src[0::4]  # R = Ambient Occlusion
+        else:
+            orm[0::4] = 1.0        # R = no occlusion
+        rough_img.pixels.foreach_get(src)
+        orm[1::4] = src[0::4]      # G = Roughness
+        metal_img.pixels.foreach_get(src)
+        orm[2::4] = src[0::4]      # B = Metallic
+        orm[3::4] = 1.0            # A = 1.0
+
+        orm_img = self._acquire_bake_image("_bake_orm", width, height)
+        orm_img.pixels.foreach_set(orm)
         return orm_img
 
 
@@ -474,19 +753,58 @@ class OBJECT_OT_bake_materials_save(Operator):
             'O': '_bake_opacity',
         }
 
+        # Images are only removed once their own PNG is on disk, so a failed
+        # write leaves the bake result in the file for another attempt.
         saved = 0
+        failed = []
+        pending = []
         for suffix, img_name in texture_map.items():
             img = bpy.data.images.get(img_name)
-            if img is not None:
-                filepath = os.path.join(output_dir, f"T_{target_name}_{suffix}.png")
+            if img is None:
+                continue
+            filepath = os.path.join(output_dir, f"T_{target_name}_{suffix}.png")
+            # Float buffers store scene-linear values; leave their conversion
+            # to Blender's own writer.
+            if oiio is None or img.is_float:
                 img.filepath_raw = filepath
                 img.file_format = 'PNG'
-                img.save()
+                try:
+                    img.save()
+                except RuntimeError as e:
+                    failed.append(f"{suffix} ({e})")
+                    continue
+                bpy.data.images.remove(img)
+                saved += 1
+            else:
+                # Copy pixels out on the main thread; encoding happens below.
+                width, height = img.size
+                pixels = np.empty(width * height * 4, dtype=np.float32)
+                img.pixels.foreach_get(pixels)
+                pending.append((suffix, img, (filepath, pixels, width, height)))
+
+        # PNG compression is CPU-bound and releases the GIL, so encode the
+        # maps in parallel.
+        if pending:
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    (suffix, img, pool.submit(_write_png, *job))
+                    for suffix, img, job in pending
+                ]
+            for suffix, img, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append(f"{suffix} ({e})")
+                    continue
                 bpy.data.images.remove(img)
                 saved += 1
 
+        if failed:
+            self.report({'ERROR'}, f"Failed to save: {', '.join(failed)}")
         if saved == 0:
-            self.report({'ERROR'}, "No baked textures found to save")
+            if not failed:
+                self.report({'ERROR'}, "No baked textures found to save")
             return {'CANCELLED'}
 
         self.report({'INFO'}, f"Saved {saved} texture(s) to {output_dir}")